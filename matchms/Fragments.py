@@ -42,6 +42,10 @@ class Fragments:
         self._mz = mz
         self._intensities = intensities
 
+        # Mark the arrays read-only so they can be shared without defensive copies.
+        self._mz.setflags(write=False)
+        self._intensities.setflags(write=False)
+
         assert self._is_sorted(), "mz values are out of order."
 
     def __eq__(self, other):
@@ -63,17 +67,17 @@ class Fragments:
         return np.all(self.mz[:-1] <= self.mz[1:])
 
     def clone(self):
-        return Fragments(self.mz, self.intensities)
+        return Fragments(self._mz, self._intensities)
 
     @property
     def mz(self):
-        """getter method for mz private variable"""
-        return self._mz.copy()
+        """getter method for mz private variable (read-only array)"""
+        return self._mz
 
     @property
     def intensities(self):
-        """getter method for intensities private variable"""
-        return self._intensities.copy()
+        """getter method for intensities private variable (read-only array)"""
+        return self._intensities
 
     @property
     def to_numpy(self):
@@ -73,12 +73,13 @@ class Metadata:
     def __eq__(self, other_metadata):
         if self.keys() != other_metadata.keys():
             return False
-        for key, value in self.items():
-
-            if isinstance(value, np.ndarray):
-                if not np.all(value == other_metadata.get(key)):
+        other_data = other_metadata._data if isinstance(other_metadata, Metadata) else other_metadata
+        for key, value in self._data.items():
+            other_value = other_data.get(key)
+            if isinstance(value, np.ndarray) or isinstance(other_value, np.ndarray):
+                if not np.array_equal(value, other_value):
                     return False
-            elif value != other_metadata.get(key):
+            elif value != other_value:
                 return False
         return True
 
@@ -106,10 +107,10 @@ class Metadata:
             metadata_filtered["ionmode"] = self.get("ionmode").lower()
 
         if metadata_filtered.get("retention_time"):
-            metadata_filtered = _add_retention(metadata_filtered, "retention_time", "retention_time")
+            metadata_filtered = _add_retention(metadata_filtered, "retention_time", ["retention_time"])
 
         if metadata_filtered.get("retention_index"):
-            metadata_filtered = _add_retention(metadata_filtered, "retention_index", "retention_index")
+            metadata_filtered = _add_retention(metadata_filtered, "retention_index", ["retention_index"])
         
         if metadata_filtered.get("parent"):
             metadata_filtered["parent"] = float(metadata_filtered.get("parent"))
@@ -130,7 +131,7 @@ class Metadata:
     def get(self, key: str, default=None):
         """Retrieve value from :attr:`metadata` dict.
         """
-        return self._data.copy().get(key, default)
+        return self._data.get(key, default)
 
     def set(self, key: str, value):
         """Set value in :attr:`metadata` dict.
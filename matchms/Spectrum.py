@@ -127,7 +127,10 @@ class Spectrum:
         return metadata_hash(self._metadata.data)
 
     def clone(self):
-        """Return a deepcopy of the spectrum instance."""
+        """Return a copy of the spectrum instance.
+
+        The metadata is copied, while the (read-only) peak arrays are shared
+        with the original spectrum."""
         clone = Spectrum(mz=self.peaks.mz,
                          intensities=self.peaks.intensities,
                          metadata=self._metadata.data,
@@ -135,6 +138,17 @@ class Spectrum:
         clone.losses = self.losses
         return clone
 
+    def _shallow_clone(self):
+        """Return a cheap clone for filters that only change metadata.
+
+        Only the metadata is copied; peaks and losses are shared with the
+        original spectrum (safe since the peak arrays are read-only)."""
+        clone = self.__class__.__new__(self.__class__)
+        clone._metadata = Metadata(self._metadata.data)
+        clone._peaks = self._peaks
+        clone._losses = self._losses
+        return clone
+
     def plot(self, figsize=(8, 6), dpi=200, **kwargs):
         """Plot to visually inspect a spectrum run ``spectrum.plot()``
 
@@ -210,7 +224,7 @@ class Spectrum:
 
     @property
     def metadata(self):
-        return self._metadata.data.copy()
+        return self._metadata.data
 
     @metadata.setter
     def metadata(self, value):
@@ -218,7 +232,7 @@ class Spectrum:
 
     @property
     def losses(self) -> Optional[Fragments]:
-        return self._losses.clone() if self._losses is not None else None
+        return self._losses
 
     @losses.setter
     def losses(self, value: Fragments):
@@ -226,7 +240,7 @@ class Spectrum:
 
     @property
     def peaks(self) -> Fragments:
-        return self._peaks.clone()
+        return self._peaks
 
     @peaks.setter
     def peaks(self, value: Fragments):
@@ -252,25 +266,45 @@ class Spectrum:
         if not isinstance(self.get("peak_comments", None), dict):
             return None
 
-        self._metadata["peak_comments"] = {
+        # Bind the comments dict once; all lookups and updates below operate
+        # on it directly instead of re-reading it through the metadata.
+        comments = {
             float(key) if isinstance(key, str) else key: value
-            for key, value in self.metadata["peak_comments"].items()
+            for key, value in self.get("peak_comments").items()
         }
+        self._metadata["peak_comments"] = comments
 
         mz_tolerance = self._peak_comments_mz_tolerance
 
         def _append_new_comment(key):
             if new_key_comment is not None:
-                comment = "; ".join([new_key_comment, self.metadata["peak_comments"].get(key)])
+                comment = "; ".join([new_key_comment, comments.get(key)])
             else:
-                comment = self.metadata["peak_comments"].get(key)
+                comment = comments.get(key)
             return comment
 
-        for key in list(self.metadata["peak_comments"].keys()):
-            if key not in peaks.mz:
-                if np.isclose(key, peaks.mz, rtol=mz_tolerance).any():
-                    new_key = peaks.mz[np.isclose(key, peaks.mz, rtol=mz_tolerance).argmax()]
-                    new_key_comment = self.metadata["peak_comments"].get(new_key, None)
+        keys = np.fromiter(comments.keys(), dtype=np.float64)
+        mz = peaks.mz
+        if keys.size == 0 or mz.size == 0:
+            has_match = np.zeros(keys.size, dtype=bool)
+            nearest_idx = np.zeros(keys.size, dtype=int)
+        else:
+            # Peaks are sorted by m/z, so the closest peak to each comment key
+            # is one of the two neighbors found by a binary search. This avoids
+            # allocating the full (keys x peaks) matrix of a broadcast isclose.
+            idx = np.searchsorted(mz, keys)
+            idx_left = np.clip(idx - 1, 0, mz.size - 1)
+            idx_right = np.clip(idx, 0, mz.size - 1)
+            choose_right = np.abs(mz[idx_right] - keys) < np.abs(mz[idx_left] - keys)
+            nearest_idx = np.where(choose_right, idx_right, idx_left)
+            has_match = np.isclose(keys, mz[nearest_idx], rtol=mz_tolerance)
+        is_present = np.isin(keys, mz)
+
+        for i, key in enumerate(keys.tolist()):
+            if not is_present[i]:
+                if has_match[i]:
+                    new_key = mz[nearest_idx[i]]
+                    new_key_comment = comments.get(new_key, None)
                     new_key_comment = _append_new_comment(key)
-                    self._metadata["peak_comments"][new_key] = new_key_comment
-                self._metadata["peak_comments"].pop(key)
+                    comments[new_key] = new_key_comment
+                comments.pop(key)
@@ -4,7 +4,7 @@ from matchms.constants import PROTON_MASS
 from matchms.filtering.filter_utils.interpret_unknown_adduct import \
     get_multiplier_and_mass_from_adduct
 from matchms.filtering.filter_utils.load_known_adducts import \
-    load_known_adducts
+    load_known_adducts_lookup
 from matchms.filtering.metadata_processing.clean_adduct import _clean_adduct
 from matchms.typing import SpectrumType
 
@@ -84,11 +84,10 @@ def _get_multiplier_and_correction_mass_from_adduct(adduct: str) -> Tuple[int, f
         Tuple[int, float]: Charge multiplier and correction mass needed to calculate the precursor mz from this adduct.
     """
     adduct = _clean_adduct(adduct)
-    known_adducts = load_known_adducts()
+    known_adducts_lookup = load_known_adducts_lookup()
 
-    if adduct in list(known_adducts["adduct"]):
-        multiplier = known_adducts.loc[known_adducts["adduct"] == adduct, "mass_multiplier"].values[0]
-        correction_mass = known_adducts.loc[known_adducts["adduct"] == adduct, "correction_mass"].values[0]
+    if adduct in known_adducts_lookup:
+        multiplier, correction_mass = known_adducts_lookup[adduct]
     else:
         multiplier, correction_mass = get_multiplier_and_mass_from_adduct(adduct)
     return multiplier, correction_mass
@@ -1,7 +1,7 @@
 import csv
 import os
 from functools import lru_cache
-from typing import Dict
+from typing import Dict, Tuple
 import pandas as pd
 
 
@@ -27,6 +27,18 @@ def load_known_adducts() -> pd.DataFrame:
     return adducts_dataframe
 
 
+@lru_cache(maxsize=4)
+def load_known_adducts_lookup() -> Dict[str, Tuple[float, float]]:
+    """Load dictionary mapping each known adduct to (mass_multiplier, correction_mass).
+
+    Cached dictionary view on :func:`load_known_adducts` for fast per-spectrum
+    lookups, avoiding a scan of the pandas DataFrame for every call.
+    """
+    known_adducts = load_known_adducts()
+    return {row.adduct: (row.mass_multiplier, row.correction_mass)
+            for row in known_adducts.itertuples()}
+
+
 @lru_cache(maxsize=4)
 def load_known_adduct_conversions() -> Dict[str, dict]:
     """Load dictionary of known adduct conversions. Makes sure that file loading is cached.
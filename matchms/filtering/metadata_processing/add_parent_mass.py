@@ -2,7 +2,6 @@ import logging
 from matchms.filtering.filter_utils.derive_precursor_mz_and_parent_mass import \
     derive_parent_mass_from_precursor_mz
 from matchms.typing import SpectrumType
-from ...utils import get_first_common_element
 
 
 logger = logging.getLogger("matchms")
@@ -10,6 +9,7 @@ logger = logging.getLogger("matchms")
 
 _default_key = "parent_mass"
 _accepted_keys = ["parentmass", "exact_mass"]
+_all_possible_keys = [_default_key] + _accepted_keys
 _accepted_types = (float, str, int)
 _accepted_missing_entries = ["", "N/A", "NA", "n/a"]
 
@@ -39,7 +39,7 @@ def add_parent_mass(spectrum_in: SpectrumType, estimate_from_adduct: bool = True
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
+    spectrum = spectrum_in._shallow_clone()
 
     parent_mass = _get_parent_mass(spectrum.metadata)
     if parent_mass is not None and not overwrite_existing_entry:
@@ -56,8 +56,7 @@ def add_parent_mass(spectrum_in: SpectrumType, estimate_from_adduct: bool = True
 
 
 def _get_parent_mass(metadata):
-    parent_mass_key = get_first_common_element([_default_key] + _accepted_keys,
-                                               metadata.keys())
+    parent_mass_key = next((key for key in _all_possible_keys if key in metadata), None)
     parent_mass = metadata.get(parent_mass_key)
     parent_mass = _convert_entry_to_num(parent_mass)
     if parent_mass not in _accepted_missing_entries:
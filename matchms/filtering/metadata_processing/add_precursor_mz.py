@@ -1,5 +1,4 @@
 import logging
-from matchms.utils import get_first_common_element
 
 
 logger = logging.getLogger("matchms")
@@ -7,6 +6,7 @@ logger = logging.getLogger("matchms")
 
 _default_key = "precursor_mz"
 _accepted_keys = ["precursormz", "precursor_mass"]
+_all_possible_keys = [_default_key] + _accepted_keys
 _accepted_types = (float, str, int)
 _accepted_missing_entries = ["", "N/A", "NA", "n/a"]
 
@@ -20,7 +20,7 @@ def add_precursor_mz(spectrum_in):
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
+    spectrum = spectrum_in._shallow_clone()
 
     metadata_updated = _add_precursor_mz_metadata(spectrum.metadata)
     spectrum.metadata = metadata_updated
@@ -46,8 +46,7 @@ def _convert_precursor_mz(precursor_mz):
 
 
 def _add_precursor_mz_metadata(metadata):
-    precursor_mz_key = get_first_common_element([_default_key] + _accepted_keys,
-                                                metadata.keys())
+    precursor_mz_key = next((key for key in _all_possible_keys if key in metadata), None)
     precursor_mz = metadata.get(precursor_mz_key)
     precursor_mz = _convert_precursor_mz(precursor_mz)
     if isinstance(precursor_mz, (float, int)):
@@ -2,7 +2,6 @@ import logging
 import re
 from typing import Any, List, Optional
 from matchms.typing import SpectrumType
-from matchms.utils import filter_none, get_common_keys
 
 
 logger = logging.getLogger("matchms")
@@ -12,27 +11,8 @@ _retention_time_keys = ["retention_time", "retentiontime", "rt", "scan_start_tim
                         "rt_query", "rtinseconds"]
 _retention_index_keys = ["retention_index", "retentionindex", "ri"]
 
-
-def _safe_store_value(metadata: dict, value: Any, target_key: str) -> dict:
-    """Helper function to safely store a value in the target key without throwing an exception, but storing 'None' instead.
-
-    Parameters
-    ----------
-    spectrum
-        Spectrum to which to add 'value' in 'target_key'.
-    value
-        Value to parse into 'target_key'.
-    target_key
-        Name of the key in which to store the value.
-
-    Returns
-    -------
-    Spectrum with added key.
-    """
-    if value is not None:   # one of accepted keys is present
-        value = _safe_convert_to_float(value)
-    metadata[target_key] = value
-    return metadata
+_retention_time_unit_pattern = re.compile(r'^[+-]?(\d*\.)?\d+\s*(min|s|h|ms)')
+_retention_time_unit_conversions = {"min": 60, "sec": 1, "s": 1, "h": 3600, "ms": 1e-3}
 
 
 def _safe_convert_to_float(value: Any) -> Optional[float]:
@@ -47,24 +27,26 @@ def _safe_convert_to_float(value: Any) -> Optional[float]:
     -------
     Converted float value or 'None' if conversion is not possible.
     """
+    # Fast path for values which are already numeric (no regex needed).
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) if value >= 0 else None
+
     try:
         if isinstance(value, list):
             if len(value) == 1:
                 value = value[0]
             else:
                 return None
-    
+
         # logic to read MoNA msp files which specify rt as string with "min" in it
         if isinstance(value, str):
             value = value.strip()
-            pattern = r'^[+-]?(\d*\.)?\d+\s*(min|s|h|ms)'
-            conversion = {"min": 60, "sec": 1, "s": 1, "h": 3600, "ms": 1e-3, "sec":1}
-            match = re.search(pattern, value)
-    
+            match = _retention_time_unit_pattern.search(value)
+
             if match and len(match.groups()) == 2:
                 val, unit = value.split(' ')
                 try:
-                    return float(val) * conversion[unit]
+                    return float(val) * _retention_time_unit_conversions[unit]
                 except:
                     return None
         try:
@@ -93,12 +75,15 @@ def _add_retention(metadata: dict, target_key: str, accepted_keys: List[str]) ->
     -------
     Spectrum with value from first accepted key stored under target_key.
     """
-    common_keys = get_common_keys(metadata.keys(), accepted_keys)
-    values_for_keys = filter_none([metadata[key] for key in common_keys])
-    values = list(map(_safe_convert_to_float, values_for_keys))
-    value = next(filter_none(values), None)
-
-    metadata = _safe_store_value(metadata, value, target_key)
+    for key in accepted_keys:
+        value = metadata.get(key)
+        if value is None:
+            continue
+        value = _safe_convert_to_float(value)
+        if value is not None:
+            metadata[target_key] = value
+            return metadata
+    metadata[target_key] = None
     return metadata
 
 
@@ -119,7 +104,7 @@ def add_retention_time(spectrum_in: SpectrumType) -> SpectrumType:
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
+    spectrum = spectrum_in._shallow_clone()
 
     target_key = "retention_time"
     spectrum.metadata = _add_retention(spectrum.metadata, target_key, _retention_time_keys)
@@ -141,7 +126,7 @@ def add_retention_index(spectrum_in: SpectrumType) -> SpectrumType:
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
+    spectrum = spectrum_in._shallow_clone()
 
     target_key = "retention_index"
     spectrum.metadata = _add_retention(spectrum.metadata, target_key, _retention_index_keys)
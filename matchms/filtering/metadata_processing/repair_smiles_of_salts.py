@@ -1,5 +1,6 @@
 import itertools
 import logging
+from bisect import bisect_left
 from matchms.filtering.filter_utils.get_neutral_mass_from_smiles import \
     get_monoisotopic_neutral_mass
 from matchms.filtering.filter_utils.smile_inchi_inchikey_conversions import \
@@ -9,6 +10,9 @@ from matchms.filtering.filter_utils.smile_inchi_inchikey_conversions import \
 logger = logging.getLogger("matchms")
 
 
+_max_exhaustive_fragments = 6
+
+
 def repair_smiles_of_salts(spectrum_in,
                            mass_tolerance):
     """Repairs the smiles of a salt to match the parent mass.
@@ -16,7 +20,7 @@ def repair_smiles_of_salts(spectrum_in,
     Checks if parent mass matches one of the ions"""
     if spectrum_in is None:
         return None
-    spectrum = spectrum_in.clone()
+    spectrum = spectrum_in._shallow_clone()
 
     smiles = spectrum.get("smiles")
     if smiles is None:
@@ -25,39 +29,76 @@ def repair_smiles_of_salts(spectrum_in,
     if not is_valid_smiles(smiles):
         return spectrum
     parent_mass = spectrum.get("parent_mass")
-    possible_ion_combinations = _create_possible_ions(smiles)
-    if not possible_ion_combinations:
+    if "." not in smiles:
         # It is not a salt
         return spectrum
-    for ion, not_used_ions in possible_ion_combinations:
-        ion_mass = get_monoisotopic_neutral_mass(ion)
-        mass_diff = abs(parent_mass - ion_mass)
-        # Check for Repair parent mass is mol wt did only return 1 spectrum. So not added as option for simplicity.
-        if mass_diff < mass_tolerance:
-            spectrum_with_ions = spectrum.clone()
-            spectrum_with_ions.set("smiles", ion)
-            spectrum_with_ions.set("salt_ions", not_used_ions)
-            logger.info("Removed salt ions: %s from %s to match parent mass",
-                        not_used_ions, smiles)
-            return spectrum_with_ions
+    single_ions = smiles.split(".")
+    # Parsing SMILES is expensive, so compute each fragment mass once and sum
+    # per combination instead of calling rdkit for every combination.
+    fragment_masses = [get_monoisotopic_neutral_mass(single_ion)
+                       for single_ion in single_ions]
+    if len(single_ions) <= _max_exhaustive_fragments:
+        matching_indices = _find_matching_ions_exhaustive(fragment_masses, parent_mass, mass_tolerance)
+    else:
+        matching_indices = _find_matching_ions_meet_in_the_middle(fragment_masses, parent_mass, mass_tolerance)
+    if matching_indices is not None:
+        used_indices = set(matching_indices)
+        ion = ".".join(single_ions[i] for i in matching_indices)
+        not_used_ions = ".".join(single_ions[i] for i in range(len(single_ions))
+                                 if i not in used_indices)
+        spectrum_with_ions = spectrum._shallow_clone()
+        spectrum_with_ions.set("smiles", ion)
+        spectrum_with_ions.set("salt_ions", not_used_ions)
+        logger.info("Removed salt ions: %s from %s to match parent mass",
+                    not_used_ions, smiles)
+        return spectrum_with_ions
     logger.warning("None of the parts of the smile %s match the parent mass: %s",
                    smiles, parent_mass)
     return spectrum
 
 
-def _create_possible_ions(smiles):
-    """Selects all possible ion combinations of a salt"""
-
-    results = []
-    if "." in smiles:
-        single_ions = smiles.split(".")
-        for r in range(1, len(single_ions) + 1):
-            combinations = itertools.combinations(single_ions, r)
-            for combination in combinations:
-                combined_ion = ".".join(combination)
-                removed_ions = single_ions.copy()
-                for used_ion in combination:
-                    removed_ions.remove(used_ion)
-                removed_ions = ".".join(removed_ions)
-                results.append((combined_ion, removed_ions))
-    return results
+def _find_matching_ions_exhaustive(fragment_masses, parent_mass, mass_tolerance):
+    """Try every fragment combination (smallest first) against the parent mass.
+
+    Returns the fragment indices of the first matching combination, or None."""
+    nr_of_ions = len(fragment_masses)
+    for r in range(1, nr_of_ions + 1):
+        for indices in itertools.combinations(range(nr_of_ions), r):
+            ion_mass = sum(fragment_masses[i] for i in indices)
+            # Check for Repair parent mass is mol wt did only return 1 spectrum. So not added as option for simplicity.
+            if abs(parent_mass - ion_mass) < mass_tolerance:
+                return indices
+    return None
+
+
+def _find_matching_ions_meet_in_the_middle(fragment_masses, parent_mass, mass_tolerance):
+    """Meet-in-the-middle search for a fragment subset matching the parent mass.
+
+    Splits the fragments in two halves and matches subset sums of one half
+    against sorted subset sums of the other, reducing the 2^n exhaustive
+    enumeration to roughly 2^(n/2) with a binary search per subset.
+    Returns the fragment indices of a matching (non-empty) combination, or None."""
+    nr_of_ions = len(fragment_masses)
+    half = nr_of_ions // 2
+    second_half = range(half, nr_of_ions)
+
+    subset_sums = []
+    for mask in range(1 << len(second_half)):
+        subset_mass = sum(fragment_masses[half + j] for j in range(len(second_half))
+                          if mask >> j & 1)
+        subset_sums.append((subset_mass, mask))
+    subset_sums.sort()
+    sorted_masses = [subset_mass for subset_mass, _ in subset_sums]
+
+    for mask_first in range(1 << half):
+        mass_first = sum(fragment_masses[i] for i in range(half) if mask_first >> i & 1)
+        position = bisect_left(sorted_masses, parent_mass - mass_first - mass_tolerance)
+        while position < len(subset_sums) and \
+                sorted_masses[position] <= parent_mass - mass_first + mass_tolerance:
+            mask_second = subset_sums[position][1]
+            if (mask_first or mask_second) and \
+                    abs(parent_mass - mass_first - sorted_masses[position]) < mass_tolerance:
+                return tuple([i for i in range(half) if mask_first >> i & 1] +
+                             [half + j for j in range(len(second_half)) if mask_second >> j & 1])
+            position += 1
+    return None
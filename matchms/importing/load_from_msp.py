@@ -1,9 +1,20 @@
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Generator, List, Tuple
+import numba
 import numpy as np
 from ..Spectrum import Spectrum
 
 
+_peak_values_pattern = re.compile(r'(\d+(?:\.\d+)?(?:e[-+]?\d+)?)')
+_peak_comment_pattern = re.compile(r'[\"\'](.*)[\"\']')
+_comments_metadata_pattern = re.compile(r'(\S+)="([^"]*)"|"(\w+)=([^"]*)"|"([^"]*)=([^"]*)"|(\S+)=(\d+(?:\.\d*)?)')
+_golm_peak_pattern = re.compile(r"(\d+:{1}\d+)")
+_golm_peak_bytes_pattern = re.compile(rb"(\d+:{1}\d+)")
+
+
 def load_from_msp(filename: str,
                   metadata_harmonization: bool = True) -> Generator[Spectrum, None, None]:
     """
@@ -36,25 +47,66 @@ def load_from_msp(filename: str,
     """
 
     for spectrum in parse_msp_file(filename):
-        try:
-            metadata = spectrum.get("params", None)
-            mz = spectrum["m/z array"]
-            intensities = spectrum["intensity array"]
-            peak_comments = spectrum["peak comments"]
-            if peak_comments != {}:
-                metadata["peak_comments"] = peak_comments
-    
-            # Sort by mz (if not sorted already)
-            if not np.all(mz[:-1] <= mz[1:]):
-                idx_sorted = np.argsort(mz)
-                mz = mz[idx_sorted]
-                intensities = intensities[idx_sorted]
-            yield Spectrum(mz=mz,
-                           intensities=intensities,
-                           metadata=metadata,
-                           metadata_harmonization=metadata_harmonization)
-        except:
-            yield None
+        yield _spectrum_from_parsed(spectrum, metadata_harmonization)
+
+
+def load_from_msp_batch(filenames: List[str],
+                        metadata_harmonization: bool = True,
+                        workers: int = None) -> Generator[Spectrum, None, None]:
+    """Load spectra from several msp files in parallel.
+
+    The files are parsed in worker processes (one file per task); only the
+    metadata dictionaries and peak arrays are sent back to the main process,
+    which creates the :py:class:`~matchms.Spectrum.Spectrum` objects. Spectra
+    are yielded in the order of the given filenames.
+
+    Parameters
+    ----------
+    filenames:
+        Paths of the msp files.
+    metadata_harmonization : bool, optional
+        Set to False if metadata harmonization to default keys is not desired.
+        The default is True.
+    workers:
+        Number of worker processes. Default is None, which uses the number
+        of processors on the machine.
+
+    Yields
+    ------
+    Yield a spectrum object for each spectrum in the given msp files.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for parsed_spectra in executor.map(_parse_msp_file_to_list, filenames, chunksize=1):
+            for spectrum in parsed_spectra:
+                yield _spectrum_from_parsed(spectrum, metadata_harmonization)
+
+
+def _parse_msp_file_to_list(filename: str) -> List[dict]:
+    """Worker function for :func:`load_from_msp_batch`."""
+    return list(parse_msp_file(filename))
+
+
+def _spectrum_from_parsed(spectrum: dict, metadata_harmonization: bool) -> Spectrum:
+    """Create a Spectrum from a parsed spectrum dictionary (None on failure)."""
+    try:
+        metadata = spectrum.get("params", None)
+        mz = spectrum["m/z array"]
+        intensities = spectrum["intensity array"]
+        peak_comments = spectrum["peak comments"]
+        if peak_comments != {}:
+            metadata["peak_comments"] = peak_comments
+
+        # Sort by mz (if not sorted already)
+        if not spectrum["is_sorted"]:
+            idx_sorted = np.argsort(mz)
+            mz = mz[idx_sorted]
+            intensities = intensities[idx_sorted]
+        return Spectrum(mz=mz,
+                        intensities=intensities,
+                        metadata=metadata,
+                        metadata_harmonization=metadata_harmonization)
+    except:
+        return None
 
 
 def parse_msp_file(filename: str) -> Generator[dict, None, None]:
@@ -62,49 +114,81 @@ def parse_msp_file(filename: str) -> Generator[dict, None, None]:
 
     # Lists/dicts that will contain all params, masses and intensities of each molecule
     params = {}
-    masses = np.array([])
-    intensities = np.array([])
+    masses = []
+    intensities = []
     peak_comments = {}
 
     # Peaks counter. Used to track and count the number of peaks
     peakscount = 0
 
-    with open(filename, 'r', encoding='utf-8') as f:
-        for line in f:
-            rline = line.rstrip()
-
-            if len(rline) == 0:
-                continue
-
-            if contains_metadata(rline):
-                parse_metadata(rline, params)
-                continue
-
-            mz, ints, comment = _parse_line_with_peaks(rline)
-
-            masses = np.append(masses, mz)
-            intensities = np.append(intensities, ints)
-            
-            if comment is not None:
-                peak_comments.update({masses[-1]: comment})
-
-            peakscount += len(mz)
-
-
-            # Obtaining the masses and intensities
-            if int(params['num peaks']) == peakscount:
-                peakscount = 0
-                yield {
-                    'params': (params),
-                    'm/z array': masses,
-                    'intensity array': intensities,
-                    'peak comments': peak_comments
-                }
-
-                params = {}
-                masses = []
-                intensities = []
-                peak_comments = {}
+    # Track whether the m/z values arrive in sorted order, so that the
+    # consumer can skip the extra sortedness check/argsort pass.
+    is_sorted = True
+    last_mz = -np.inf
+
+    # Memory-map the file and work on raw bytes: peak lines (the bulk of the
+    # file) go straight to the byte-level tokenizer, only metadata and comment
+    # lines are decoded to str.
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            for line in iter(mapped_file.readline, b""):
+                rline = line.rstrip()
+
+                if len(rline) == 0:
+                    continue
+
+                # Peak lines start with a digit (or a dot); for those, only the GOLM
+                # mz:intensity corner case requires the metadata check at all.
+                first_byte = rline[0]
+                if 48 <= first_byte <= 57 or first_byte == 46:  # digit or '.'
+                    if b':' in rline and not _golm_peak_bytes_pattern.match(rline):
+                        parse_metadata(rline.decode('utf-8'), params)
+                        continue
+                elif b':' in rline:
+                    parse_metadata(rline.decode('utf-8'), params)
+                    continue
+
+                if b'"' in rline or b"'" in rline:
+                    # Possible peak comment; decode and take the slower regex path.
+                    mz, ints, comment = _parse_line_with_peaks(rline.decode('utf-8'))
+                else:
+                    mz, ints = _scan_mz_intensity(rline)
+                    comment = None
+
+                masses.extend(mz)
+                intensities.extend(ints)
+
+                if is_sorted:
+                    for value in mz:
+                        if value < last_mz:
+                            is_sorted = False
+                            break
+                        last_mz = value
+
+                if comment is not None:
+                    peak_comments.update({masses[-1]: comment})
+
+                peakscount += len(mz)
+
+                # Obtaining the masses and intensities
+                if int(params['num peaks']) == peakscount:
+                    peakscount = 0
+                    yield {
+                        'params': (params),
+                        'm/z array': np.asarray(masses, dtype=np.float64),
+                        'intensity array': np.asarray(intensities, dtype=np.float64),
+                        'peak comments': peak_comments,
+                        'is_sorted': is_sorted
+                    }
+
+                    params = {}
+                    masses = []
+                    intensities = []
+                    peak_comments = {}
+                    is_sorted = True
+                    last_mz = -np.inf
             
 
 
@@ -118,15 +202,90 @@ def _parse_line_with_peaks(rline: str) -> Tuple[List[float], List[float], str]:
     Returns:
         Tuple[List[float], List[float], str]: mz, intensity and peak comments obtained from the line.
     """
-    comment, rline = get_peak_comment(rline)   
-    mz, intensities = get_peak_values(rline)
-    
+    comment, rline = get_peak_comment(rline)
+    if comment is None:
+        mz, intensities = _scan_mz_intensity(rline)
+    else:
+        mz, intensities = get_peak_values(rline)
+
     return mz, intensities, comment
 
 
+def _scan_mz_intensity(line) -> Tuple[np.ndarray, np.ndarray]:
+    """Tokenize a peak line without comments into m/z and intensity arrays.
+
+    Fast replacement for :func:`get_peak_values` on the (most common) peak lines
+    without comments. Accepts the line as str or bytes. The byte-level scan is
+    compiled with numba and recognizes the same numeric tokens as the regex in
+    :func:`get_peak_values`.
+    """
+    if isinstance(line, str):
+        line = line.encode('utf-8')
+    values = _tokenize_peak_values(np.frombuffer(line, dtype=np.uint8))
+    if values.size % 2 != 0:
+        raise RuntimeError("Wrong peak format detected!")
+    return values[0::2], values[1::2]
+
+
+@numba.njit(cache=True)
+def _tokenize_peak_values(line_bytes: np.ndarray) -> np.ndarray:
+    """Scan a peak line given as uint8 array and return all numeric tokens.
+
+    Accepts the same tokens as the regex ``(\\d+(?:\\.\\d+)?(?:e[-+]?\\d+)?)``:
+    an integer part, an optional fraction and an optional exponent. All other
+    bytes act as separators.
+    """
+    n = line_bytes.size
+    values = np.empty((n + 1) // 2, dtype=np.float64)
+    count = 0
+    i = 0
+    while i < n:
+        if not 48 <= line_bytes[i] <= 57:  # not a digit
+            i += 1
+            continue
+        mantissa = 0.0
+        decimal_exponent = 0
+        while i < n and 48 <= line_bytes[i] <= 57:
+            mantissa = mantissa * 10.0 + (line_bytes[i] - 48)
+            i += 1
+        if i + 1 < n and line_bytes[i] == 46 and 48 <= line_bytes[i + 1] <= 57:  # '.'
+            i += 1
+            while i < n and 48 <= line_bytes[i] <= 57:
+                mantissa = mantissa * 10.0 + (line_bytes[i] - 48)
+                decimal_exponent -= 1
+                i += 1
+        if i < n and line_bytes[i] == 101:  # 'e'
+            j = i + 1
+            exponent_sign = 1
+            if j < n and (line_bytes[j] == 43 or line_bytes[j] == 45):  # '+'/'-'
+                if line_bytes[j] == 45:
+                    exponent_sign = -1
+                j += 1
+            if j < n and 48 <= line_bytes[j] <= 57:
+                exponent = 0
+                while j < n and 48 <= line_bytes[j] <= 57:
+                    exponent = exponent * 10 + (line_bytes[j] - 48)
+                    j += 1
+                decimal_exponent += exponent_sign * exponent
+                i = j
+        if decimal_exponent != 0:
+            # Scale by an exactly representable power of ten so that results
+            # match Python's float() bit-for-bit for typical peak values.
+            power_of_ten = 1.0
+            for _ in range(abs(decimal_exponent)):
+                power_of_ten *= 10.0
+            if decimal_exponent < 0:
+                mantissa /= power_of_ten
+            else:
+                mantissa *= power_of_ten
+        values[count] = mantissa
+        count += 1
+    return values[:count]
+
+
 def get_peak_values(peak: str) -> Tuple[List[float], List[float]]:
     """ Get the m/z and intensity value from the line containing the peak information. """
-    tokens = re.findall(r'(\d+(?:\.\d+)?(?:e[-+]?\d+)?)', peak)
+    tokens = _peak_values_pattern.findall(peak)
     if len(tokens) % 2 != 0:
         raise RuntimeError("Wrong peak format detected!")
     
@@ -139,7 +298,7 @@ def get_peak_values(peak: str) -> Tuple[List[float], List[float]]:
 def get_peak_comment(rline: str) -> Tuple[str, str]:
     """ Get the peak comment from the line containing the peak information. """
     try:
-        comment = re.findall(r'[\"\'](.*)[\"\']', rline)[0]
+        comment = _peak_comment_pattern.findall(rline)[0]
         rline = rline[:rline.index("\"")]
     except IndexError:
         comment = None
@@ -151,8 +310,7 @@ def parse_metadata(rline: str, params: dict):
     matches = []
     splitted_line = rline.split(":", 1)
     if splitted_line[0].lower() == 'comments' and "=" in splitted_line[1]:
-        pattern = r'(\S+)="([^"]*)"|"(\w+)=([^"]*)"|"([^"]*)=([^"]*)"|(\S+)=(\d+(?:\.\d*)?)'
-        matches = re.findall(pattern, splitted_line[1].replace("'", '"'))
+        matches = _comments_metadata_pattern.findall(splitted_line[1].replace("'", '"'))
         for match in matches:
             try:
                 match = [i for i in match if i]
@@ -185,4 +343,4 @@ def _is_golm_peak_format(rline: str) -> bool:
     Returns:
         bool: Whether the line is a line with peaks from GOLM or not.
     """
-    return re.match(r"(\d+:{1}\d+)", rline) is not None
+    return _golm_peak_pattern.match(rline) is not None
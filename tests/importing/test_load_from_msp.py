@@ -1,7 +1,7 @@
 import os
 import numpy as np
 from matchms import Spectrum
-from matchms.importing import load_from_msp
+from matchms.importing import load_from_msp, load_from_msp_batch
 from tests.builder_Spectrum import SpectrumBuilder
 
 
@@ -264,3 +264,15 @@ def test_load_msp_with_scientific_notation():
     actual = list(load_from_msp(spectrums_file))
     
     assert len(actual) == 3
+
+
+def test_load_from_msp_batch():
+    """Parallel batch loading should yield the same spectra as serial loading."""
+    module_root = os.path.join(os.path.dirname(__file__), "..")
+    spectrums_files = [os.path.join(module_root, "testdata", filename)
+                       for filename in ["MoNA-export-GC-MS-first10.msp", "golm.msp"]]
+
+    expected = [spectrum for file in spectrums_files for spectrum in load_from_msp(file)]
+    actual = list(load_from_msp_batch(spectrums_files, workers=2))
+
+    assert actual == expected
@@ -31,7 +31,7 @@ def test_spectrum_hash_changed_length(spectrum):
 
 
 def test_spectrum_hash_changed_mz_precision(spectrum: Spectrum):
-    mz2 = spectrum.peaks.mz
+    mz2 = spectrum.peaks.mz.copy()
     mz2[0] += 0.01
     spectrum2 = SpectrumBuilder().from_spectrum(spectrum).with_mz(mz2).build()
 
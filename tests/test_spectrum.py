@@ -38,7 +38,7 @@ def spectrum() -> Spectrum:
 
 
 def test_spectrum_getters_return_copies():
-    """Test if getters return (deep)copies so that edits won't change the original entries."""
+    """Test if getters return copies (or read-only arrays) so that edits won't change the original entries."""
     spectrum = Spectrum(mz=np.array([100.0, 101.0], dtype="float"),
                         intensities=np.array([0.4, 0.5], dtype="float"),
                         metadata={"testdata": 1}, metadata_harmonization=False)
@@ -46,8 +46,8 @@ def test_spectrum_getters_return_copies():
     testdata = spectrum.get("testdata")
     testdata += 1
     assert spectrum.get("testdata") == 1, "Expected different entry"
-    peaks_mz = spectrum.peaks.mz
-    peaks_mz += 100.0
+    with pytest.raises(ValueError):
+        spectrum.peaks.mz += 100.0
     assert np.all(spectrum.peaks.mz == np.array([100.0, 101.0])), "Expected different peaks.mz"
     metadata = spectrum.metadata
     metadata["added_info"] = "this"
@@ -57,9 +57,10 @@ def test_spectrum_getters_return_copies():
 def test_spectrum_getters(spectrum: Spectrum):
     assert np.all(spectrum.mz == spectrum.peaks.mz)
     assert np.all(spectrum.intensities == spectrum.peaks.intensities)
-    # Test if true copy
+    # Peak arrays are read-only and cannot be modified in place
     mz = spectrum.mz
-    mz[0] = 1111
+    with pytest.raises(ValueError):
+        mz[0] = 1111
     assert np.allclose(spectrum.peaks.mz[0], 100.00003)
 
 
@@ -181,6 +182,21 @@ def test_spectrum_clone(spectrum, default_filtering):
     assert spectrum_clone != spectrum.clone(), "Only cloned spectrum should have changed"
 
 
+@pytest.mark.parametrize("default_filtering", [True, False])
+def test_spectrum_shallow_clone(spectrum, default_filtering):
+    spectrum = SpectrumBuilder().from_spectrum(spectrum).with_metadata(
+        {"pepmass": (444.1, 11), "TEST FIELD": "Some Text"},
+        metadata_harmonization=default_filtering).build()
+    spectrum_clone = spectrum._shallow_clone()
+
+    assert spectrum_clone == spectrum, "Spectra should be equal"
+    assert spectrum_clone.peaks.mz is spectrum.peaks.mz, "Expected peak arrays to be shared"
+
+    # Check that the metadata is an independent copy
+    spectrum_clone.set("test_field", "Other Text")
+    assert spectrum.get("test_field") == "Some Text", "Only cloned spectrum should have changed"
+
+
 @pytest.mark.parametrize("input_dict, default_filtering, expected", [
     [{}, True, {}],
     [{"precursor_mz": 101.01}, True, {"precursor_mz": 101.01}],